@@ -99,8 +99,7 @@ def generate_single_har_report(
     # Write HTML file
     with open(output_file, "w", encoding="utf-8") as f:
         f.write(html_content)
-
-    file_size = os.path.getsize(output_file) / 1024
+        file_size = f.tell() / 1024
     print(f"SUCCESS: Report generated: {output_file} ({file_size:.1f} KB)")
 
     # Open in browser if requested
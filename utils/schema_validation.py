@@ -6,6 +6,7 @@ Provides utilities for validating JSON data against a schema.
 This module uses jsonschema to validate data structures against JSON schemas.
 """
 
+import functools
 import json
 import os
 from pathlib import Path
@@ -18,13 +19,81 @@ except ImportError:
     HAS_JSONSCHEMA = False
     print("Warning: jsonschema package not found. Schema validation will be limited.")
 
+# Prefer the Rust-backed jsonschema-rs validator when it is installed;
+# releases without Draft7Validator are ignored
+try:
+    import jsonschema_rs
+    HAS_JSONSCHEMA_RS = hasattr(jsonschema_rs, "Draft7Validator")
+except ImportError:
+    HAS_JSONSCHEMA_RS = False
+
+# Prefer orjson for loading schema files when it is installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Path to schema directory
 SCHEMA_DIR = Path(__file__).parent.parent / "schemas"
 
+class _FallbackValidator:
+    """
+    Validate with jsonschema-rs, falling back to jsonschema per call.
+
+    jsonschema-rs raises ValueError for Python objects it cannot map to JSON
+    (datetime, set, non-string dict keys); jsonschema reports those as
+    ordinary validation errors, so such documents are handed to it instead.
+    """
+
+    def __init__(self, fast_validator: Any, validator: Any):
+        self._fast_validator = fast_validator
+        self._validator = validator
+
+    def is_valid(self, data: Any) -> bool:
+        try:
+            return self._fast_validator.is_valid(data)
+        except ValueError:
+            return self._validator.is_valid(data)
+
+    def iter_errors(self, data: Any) -> Any:
+        try:
+            return self._fast_validator.iter_errors(data)
+        except ValueError:
+            return self._validator.iter_errors(data)
+
+@functools.lru_cache(maxsize=32)
+def _get_validator(schema_path: str, mtime: float) -> Any:
+    """
+    Load a schema file and build its validator once per (path, mtime).
+
+    The mtime is part of the cache key so that editing a schema on disk
+    invalidates the cached validator on the next call. Returns a
+    jsonschema_rs-backed _FallbackValidator when available, otherwise
+    jsonschema's Draft7Validator; both provide is_valid() and iter_errors().
+    """
+    schema = _json_loads(Path(schema_path).read_bytes())
+    jsonschema.Draft7Validator.check_schema(schema)
+    validator = jsonschema.Draft7Validator(schema)
+    if HAS_JSONSCHEMA_RS:
+        try:
+            # jsonschema only annotates "format" for Draft 7; match that so both
+            # backends accept the same documents (e.g. naive ISO timestamps)
+            fast_validator = jsonschema_rs.Draft7Validator(
+                schema, validate_formats=False
+            )
+        except TypeError:
+            # Older jsonschema-rs without validate_formats
+            return validator
+        return _FallbackValidator(fast_validator, validator)
+    return validator
+
 def validate_against_schema(
     data: Dict[str, Any], 
     schema_file: str = "agent_summary_schema.json", 
-    raise_exception: bool = False
+    raise_exception: bool = False,
+    errors_needed: bool = True,
+    first_error_only: bool = False
 ) -> Dict[str, Any]:
     """
     Validate data against a JSON schema
@@ -33,6 +102,10 @@ def validate_against_schema(
         data: Data to validate
         schema_file: Schema file name (in schemas directory)
         raise_exception: Whether to raise an exception on validation failure
+        errors_needed: Whether to collect error messages; when False only
+            the validity flag is computed and "errors" stays None
+        first_error_only: Stop at the first validation error instead of
+            collecting every error in the document
         
     Returns:
         Dictionary with validation results:
@@ -56,19 +129,20 @@ def validate_against_schema(
         
     schema_path = SCHEMA_DIR / schema_file
     
-    # Check if schema file exists
-    if not schema_path.exists():
+    # Check if schema file exists; the mtime doubles as the validator cache key
+    try:
+        schema_mtime = schema_path.stat().st_mtime
+    except FileNotFoundError:
         result["valid"] = False
         result["errors"] = [f"Schema file not found: {schema_path}"]
         
         if raise_exception:
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
+            raise FileNotFoundError(f"Schema file not found: {schema_path}") from None
         return result
     
-    # Load schema
+    # Load schema (cached per path and modification time)
     try:
-        with open(schema_path, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
+        validator = _get_validator(str(schema_path), schema_mtime)
     except Exception as e:
         result["valid"] = False
         result["errors"] = [f"Error loading schema: {str(e)}"]
@@ -78,23 +152,40 @@ def validate_against_schema(
         return result
     
     # Validate data
-    validator = jsonschema.Draft7Validator(schema)
-    errors = list(validator.iter_errors(data))
+    if not errors_needed:
+        if not validator.is_valid(data):
+            result["valid"] = False
+            
+            if raise_exception:
+                raise jsonschema.exceptions.ValidationError("Validation failed")
+        return result
     
-    if errors:
-        result["valid"] = False
-        result["errors"] = [_format_validation_error(error) for error in errors]
-        
-        if raise_exception:
-            raise jsonschema.exceptions.ValidationError(
-                f"Validation failed: {len(errors)} errors found"
-            )
+    first_error = next(validator.iter_errors(data), None)
+    if first_error is None:
+        return result
+    
+    result["valid"] = False
+    
+    # Failing fast only needs the first error, so skip collecting the rest
+    if raise_exception:
+        raise jsonschema.exceptions.ValidationError(
+            f"Validation failed: {_format_validation_error(first_error)}"
+        )
+    
+    if first_error_only:
+        errors = [first_error]
+    else:
+        errors = list(validator.iter_errors(data))
+    result["errors"] = [_format_validation_error(error) for error in errors]
     
     return result
 
-def _format_validation_error(error: jsonschema.exceptions.ValidationError) -> str:
-    """Format a validation error into a human-readable message"""
-    path = "/".join(str(p) for p in error.path) if error.path else "root"
+def _format_validation_error(error: Any) -> str:
+    """Format a jsonschema or jsonschema_rs validation error into a message"""
+    error_path = getattr(error, "instance_path", None)
+    if error_path is None:
+        error_path = error.path
+    path = "/".join(map(str, error_path)) if error_path else "root"
     return f"At {path}: {error.message}"
 
 def check_missing_fields(data: Dict[str, Any], required_fields: Dict[str, List[str]]) -> List[str]:
@@ -115,8 +206,11 @@ def check_missing_fields(data: Dict[str, Any], required_fields: Dict[str, List[s
             errors.append(f"Missing required section: '{section}'")
             continue
             
-        for field in fields:
-            if field not in data[section]:
-                errors.append(f"Missing required field: '{section}.{field}'")
+        present = data[section]
+        errors.extend(
+            f"Missing required field: '{section}.{field}'"
+            for field in fields
+            if field not in present
+        )
                 
     return errors
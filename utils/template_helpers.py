@@ -9,59 +9,79 @@ formatting, and other utilities.
 
 import re
 import json
+from bisect import bisect_right
 from datetime import datetime
 from typing import Any, Dict, List, Union, Optional
 
+from utils.template_utilities import safe_get as _safe_get_path
 
-def safe_get(data: Dict[str, Any], key: str, default: Any = None) -> Any:
-    """Safely get a value from a dictionary, return default if not found."""
-    if data is None:
-        return default
-    return data.get(key, default)
+# Sentinel distinguishing a missing key from a stored None
+_MISSING = object()
 
+# Scheme and host of an absolute URL, compiled once for truncate_url
+_URL_RE = re.compile(r"https?://([^/]+)")
 
-def safe_format_time(milliseconds: Union[int, float, str, None], 
-                    default: str = "N/A") -> str:
-    """Format milliseconds as a human-readable string with appropriate units."""
-    if milliseconds is None:
+# Unit tables for _format_scaled: lower bound of each unit and its
+# (divisor, suffix). Values below the first bound render as zero.
+_TIME_THRESHOLDS = (1, 1000, 60000)
+_TIME_UNITS = ((1, "ms"), (1000, "s"), (60000, "min"))
+_SIZE_THRESHOLDS = (1, 1024, 1024 ** 2, 1024 ** 3)
+_SIZE_UNITS = ((1, "B"), (1024, "KB"), (1024 ** 2, "MB"), (1024 ** 3, "GB"))
+
+# Characters a JSON document can start with (NaN/Infinity are accepted by json)
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+# Loose date / date-time shapes that fromisoformat may reject (e.g. no padding)
+_LOOSE_DATE_RE = re.compile(r"\d{4}-\d{1,2}-\d{1,2}$")
+_LOOSE_DATETIME_RE = re.compile(r"\d{4}-\d{1,2}-\d{1,2}T\d{1,2}:\d{1,2}:\d{1,2}$")
+
+
+def safe_get(data: Dict[str, Any], key: Any, default: Any = None) -> Any:
+    """
+    Safely get a value from a dictionary, return default if not found.
+    
+    The key is looked up as-is first, so keys containing dots (domains,
+    URLs) resolve directly; a dotted key that is not present is then
+    followed as a nested path via template_utilities.safe_get.
+    """
+    try:
+        value = data.get(key, _MISSING)
+    except AttributeError:
         return default
-        
+    if value is not _MISSING:
+        return value
+    if isinstance(key, str) and "." in key:
+        return _safe_get_path(data, key, default)
+    return default
+
+
+def _format_scaled(value: Any, default: str, thresholds: tuple, units: tuple) -> str:
+    """Format a number using the largest unit whose lower bound it reaches."""
     try:
-        ms = float(milliseconds)
+        val = float(value)
     except (ValueError, TypeError):
         return default
         
-    if ms < 1:
-        return "0ms"
-    elif ms < 1000:
-        return f"{int(ms)}ms"
-    elif ms < 60000:
-        return f"{ms/1000:.2f}s"
-    else:
-        return f"{ms/60000:.2f}min"
+    index = bisect_right(thresholds, val)
+    if index == 0:
+        return f"0{units[0][1]}"
+        
+    divisor, suffix = units[index - 1]
+    if index == 1:
+        return f"{int(val)}{suffix}"
+    return f"{val / divisor:.2f}{suffix}"
+
+
+def safe_format_time(milliseconds: Union[int, float, str, None], 
+                    default: str = "N/A") -> str:
+    """Format milliseconds as a human-readable string with appropriate units."""
+    return _format_scaled(milliseconds, default, _TIME_THRESHOLDS, _TIME_UNITS)
 
 
 def safe_format_size(bytes_value: Union[int, float, str, None],
                     default: str = "N/A") -> str:
     """Format bytes as a human-readable string with appropriate units."""
-    if bytes_value is None:
-        return default
-        
-    try:
-        bytes_val = float(bytes_value)
-    except (ValueError, TypeError):
-        return default
-        
-    if bytes_val < 1:
-        return "0B"
-    elif bytes_val < 1024:
-        return f"{int(bytes_val)}B"
-    elif bytes_val < 1024 * 1024:
-        return f"{bytes_val/1024:.2f}KB"
-    elif bytes_val < 1024 * 1024 * 1024:
-        return f"{bytes_val/(1024*1024):.2f}MB"
-    else:
-        return f"{bytes_val/(1024*1024*1024):.2f}GB"
+    return _format_scaled(bytes_value, default, _SIZE_THRESHOLDS, _SIZE_UNITS)
 
 
 def safe_length(value: Any, default: int = 0) -> int:
@@ -79,6 +99,10 @@ def safe_json_parse(json_string: str, default: Any = None) -> Any:
     if not json_string or not isinstance(json_string, str):
         return default
         
+    # Skip the parser entirely for text that cannot start a JSON value
+    if json_string.lstrip()[:1] not in _JSON_START_CHARS:
+        return default
+        
     try:
         return json.loads(json_string)
     except json.JSONDecodeError:
@@ -93,26 +117,13 @@ def truncate_url(url: str, max_length: int = 50) -> str:
     if len(url) <= max_length:
         return url
         
-    # Extract domain
-    match = re.search(r"https?://([^/]+)", url)
-    if not match:
-        return url[:max_length-3] + "..."
+    # If the domain itself is too long, spend the budget on it, not the scheme
+    match = _URL_RE.match(url)
+    if match and match.end(1) - match.start(1) > max_length - 10:
+        return match.group(1)[:max_length-3] + "..."
         
-    domain = match.group(1)
-    prefix = match.group(0)  # http:// or https://
-    
-    # If domain itself is too long, truncate it
-    if len(domain) > max_length - 10:
-        return domain[:max_length-3] + "..."
-        
-    # Try to keep the domain and part of the path
-    path_max = max_length - len(prefix) - 3
-    path_part = url[len(prefix):]
-    
-    if len(path_part) > path_max:
-        path_part = path_part[:path_max] + "..."
-            
-    return f"{prefix}{path_part}"
+    # Otherwise scheme and domain come first, so one slice keeps them
+    return url[:max_length-3] + "..."
 
 
 def format_date(date_string: str, 
@@ -124,34 +135,44 @@ def format_date(date_string: str,
         
     try:
         # Try ISO format first
-        date = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-        return date.strftime(format_str)
-    except (ValueError, AttributeError):
-        # Try other common formats
-        try:
-            date = datetime.strptime(date_string, "%Y-%m-%d")
-            return date.strftime(format_str)
-        except ValueError:
-            pass
-            
         try:
-            date = datetime.strptime(date_string, "%Y-%m-%dT%H:%M:%S")
-            return date.strftime(format_str)
+            date = datetime.fromisoformat(date_string)
         except ValueError:
-            return default
+            if 'Z' not in date_string:
+                raise
+            # Pre-3.11 fromisoformat rejects "Z", and 3.11+ still rejects
+            # forms such as "2023-07-25Z"; spell the offset out and retry
+            date = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
+        return date.strftime(format_str)
+    except (ValueError, AttributeError):
+        pass
+        
+    # Only hand strings of a known shape to strptime, which is comparatively slow
+    if _LOOSE_DATE_RE.match(date_string):
+        fallback_format = "%Y-%m-%d"
+    elif _LOOSE_DATETIME_RE.match(date_string):
+        fallback_format = "%Y-%m-%dT%H:%M:%S"
+    else:
+        return default
+        
+    try:
+        date = datetime.strptime(date_string, fallback_format)
+        return date.strftime(format_str)
+    except ValueError:
+        return default
 
 
 def get_css_class(value: Union[int, float, None], 
                  thresholds: Dict[str, Union[int, float]],
                  default: str = "info") -> str:
     """Get a CSS class based on thresholds."""
-    if value is None:
-        return default
-        
-    try:
-        val = float(value)
-    except (ValueError, TypeError):
-        return default
+    if isinstance(value, (int, float)):
+        val = value
+    else:
+        try:
+            val = float(value)
+        except (ValueError, TypeError):
+            return default
         
     if "danger" in thresholds and val >= thresholds["danger"]:
         return "danger"
@@ -169,6 +190,10 @@ def percentage(value: Union[int, float], total: Union[int, float],
     if not value or not total:
         return default
         
+    # Numbers need no float() conversion; total is non-zero at this point
+    if isinstance(value, (int, float)) and isinstance(total, (int, float)):
+        return f"{value / total * 100:.1f}%"
+        
     try:
         percent = (float(value) / float(total)) * 100
         return f"{percent:.1f}%"
@@ -176,14 +201,20 @@ def percentage(value: Union[int, float], total: Union[int, float],
         return default
 
 
+# Filter name -> function mapping registered by register_template_filters
+_FILTERS = {
+    "safe_get": safe_get,
+    "safe_format_time": safe_format_time,
+    "safe_format_size": safe_format_size,
+    "safe_length": safe_length,
+    "safe_json_parse": safe_json_parse,
+    "truncate_url": truncate_url,
+    "format_date": format_date,
+    "get_css_class": get_css_class,
+    "percentage": percentage,
+}
+
+
 def register_template_filters(app):
     """Register all template filters with a Flask app."""
-    app.jinja_env.filters["safe_get"] = safe_get
-    app.jinja_env.filters["safe_format_time"] = safe_format_time
-    app.jinja_env.filters["safe_format_size"] = safe_format_size
-    app.jinja_env.filters["safe_length"] = safe_length
-    app.jinja_env.filters["safe_json_parse"] = safe_json_parse
-    app.jinja_env.filters["truncate_url"] = truncate_url
-    app.jinja_env.filters["format_date"] = format_date
-    app.jinja_env.filters["get_css_class"] = get_css_class
-    app.jinja_env.filters["percentage"] = percentage
+    app.jinja_env.filters.update(_FILTERS)
@@ -7,8 +7,30 @@ This module provides functions to safely access and format data for templates,
 particularly for handling null or missing values gracefully.
 """
 
+import functools
 import json
-from typing import Any, Dict, List, Optional, Union
+import math
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Characters that can follow "[" in a JSON array (a value start or "]")
+_JSON_ARRAY_NEXT_CHARS = frozenset('{["-0123456789tfnNI]')
+
+# Sentinel distinguishing a missing key from a stored None
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_path(path: str) -> Tuple[str, ...]:
+    """
+    Split a dot notation path into its keys, caching the result.
+    
+    Args:
+        path: Dot notation path (e.g., "metadata.har_name")
+        
+    Returns:
+        Tuple of path segments
+    """
+    return tuple(path.split("."))
 
 
 def safe_get(data: Dict[str, Any], path: str, default: Any = None) -> Any:
@@ -22,20 +44,35 @@ def safe_get(data: Dict[str, Any], path: str, default: Any = None) -> Any:
         
     Returns:
         Value at path or default if not found
+    
+    Any object with a dict-style ``get`` method is traversed; other values
+    (None, lists, strings, numbers) yield the default at any level. Dotted
+    paths are always split, so a key that itself contains dots cannot be
+    reached here; template_helpers.safe_get looks such keys up first.
     """
-    if not data or not isinstance(data, dict):
-        return default
-        
-    if "." not in path:
-        return data.get(path, default)
+    if not isinstance(path, str) or "." not in path:
+        # Non-string keys and single-level lookups go straight to .get;
+        # non-mappings fail with AttributeError
+        try:
+            return data.get(path, default)
+        except AttributeError:
+            return default
     
-    parts = path.split(".", 1)
-    first, rest = parts[0], parts[1]
+    return _nested_get(data, path, default)
+
+
+def _nested_get(data: Any, path: str, default: Any) -> Any:
+    """Walk a dot notation path through nested mappings."""
+    current = data
+    for key in compile_path(path):
+        try:
+            current = current.get(key, _MISSING)
+        except AttributeError:
+            return default
+        if current is _MISSING:
+            return default
     
-    if first not in data:
-        return default
-        
-    return safe_get(data[first], rest, default)
+    return current
 
 
 def safe_number(value: Any, default: Union[int, float] = 0) -> Union[int, float]:
@@ -57,6 +94,12 @@ def safe_number(value: Any, default: Union[int, float] = 0) -> Union[int, float]
         
     # Handle string representations
     if isinstance(value, str):
+        # Fast path for plain numeric strings such as "100" or "2.5"
+        try:
+            return float(value) if '.' in value else int(value)
+        except ValueError:
+            pass
+            
         # Remove formatting
         clean_value = value.replace(',', '').replace('s', '').strip()
         try:
@@ -112,13 +155,20 @@ def format_bytes(bytes_value: Any, precision: int = 1, default: str = "0B") -> s
         return default
         
     units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
     
-    while bytes_val >= 1024 and unit_index < len(units) - 1:
-        bytes_val /= 1024
-        unit_index += 1
+    if isinstance(bytes_val, float) and not math.isfinite(bytes_val):
+        # inf/nan have no bit length; keep the unscaled value as before
+        unit_index = len(units) - 1 if bytes_val > 0 else 0
+        scaled = bytes_val
+    else:
+        # Each unit step is 2**10, so the unit follows from the bit length
+        whole = int(bytes_val)
+        unit_index = 0
+        if whole > 0:
+            unit_index = min((whole.bit_length() - 1) // 10, len(units) - 1)
+        scaled = bytes_val / (1 << (unit_index * 10))
     
-    return f"{bytes_val:.{precision}f}{units[unit_index]}"
+    return f"{scaled:.{precision}f}{units[unit_index]}"
 
 
 def ensure_list(value: Any) -> List:
@@ -139,7 +189,11 @@ def ensure_list(value: Any) -> List:
         
     if isinstance(value, str):
         # Handle string-encoded JSON arrays
-        if value.startswith('[') and value.endswith(']'):
+        if (
+            value.startswith('[')
+            and value.endswith(']')
+            and value[1:].lstrip()[:1] in _JSON_ARRAY_NEXT_CHARS
+        ):
             try:
                 return json.loads(value)
             except json.JSONDecodeError:
@@ -0,0 +1,263 @@
+"""
+Test Schema Validation
+====================
+Tests for the schema_validation module.
+
+These tests validate against a small schema written to a temporary
+directory, so they do not depend on the shipped agent summary schema.
+"""
+
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+# Add parent directory to path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from utils import schema_validation
+from utils.schema_validation import (
+    HAS_JSONSCHEMA,
+    HAS_JSONSCHEMA_RS,
+    check_missing_fields,
+    validate_against_schema
+)
+
+if HAS_JSONSCHEMA:
+    import jsonschema
+
+TEST_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["name", "count"],
+    "properties": {
+        "name": {"type": "string"},
+        "count": {"type": "integer"}
+    }
+}
+
+VALID_DOC = {"name": "example", "count": 3}
+INVALID_DOC = {"name": 5}  # wrong type for name, missing count
+
+
+@unittest.skipUnless(HAS_JSONSCHEMA, "jsonschema package not installed")
+class TestValidateAgainstSchema(unittest.TestCase):
+    """Test suite for validate_against_schema."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.schema_dir = Path(self.temp_dir.name)
+        self.schema_path = self.schema_dir / "test_schema.json"
+        self._write_schema(TEST_SCHEMA)
+
+        patcher = mock.patch.object(schema_validation, "SCHEMA_DIR", self.schema_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.temp_dir.cleanup)
+        schema_validation._get_validator.cache_clear()
+        self.addCleanup(schema_validation._get_validator.cache_clear)
+
+    def _write_schema(self, schema):
+        self.schema_path.write_text(json.dumps(schema), encoding="utf-8")
+
+    def _validate(self, data, **kwargs):
+        return validate_against_schema(data, schema_file="test_schema.json", **kwargs)
+
+    def test_default_mode(self):
+        """Test that all errors are collected by default."""
+        result = self._validate(VALID_DOC)
+        self.assertTrue(result["valid"])
+        self.assertIsNone(result["errors"])
+        self.assertIs(result["data"], VALID_DOC)
+
+        result = self._validate(INVALID_DOC)
+        self.assertFalse(result["valid"])
+        self.assertEqual(len(result["errors"]), 2)
+        self.assertTrue(any("count" in error for error in result["errors"]))
+        self.assertTrue(any(error.startswith("At name:") for error in result["errors"]))
+
+    def test_errors_not_needed(self):
+        """Test that errors stay None when errors_needed is False."""
+        result = self._validate(VALID_DOC, errors_needed=False)
+        self.assertTrue(result["valid"])
+        self.assertIsNone(result["errors"])
+
+        result = self._validate(INVALID_DOC, errors_needed=False)
+        self.assertFalse(result["valid"])
+        self.assertIsNone(result["errors"])
+
+        with self.assertRaises(jsonschema.exceptions.ValidationError):
+            self._validate(INVALID_DOC, errors_needed=False, raise_exception=True)
+
+    def test_first_error_only(self):
+        """Test that only the first error is reported when requested."""
+        result = self._validate(VALID_DOC, first_error_only=True)
+        self.assertTrue(result["valid"])
+        self.assertIsNone(result["errors"])
+
+        result = self._validate(INVALID_DOC, first_error_only=True)
+        self.assertFalse(result["valid"])
+        self.assertEqual(len(result["errors"]), 1)
+
+    def test_validator_is_cached(self):
+        """Test that repeated calls reuse the compiled validator."""
+        self._validate(VALID_DOC)
+        self._validate(INVALID_DOC)
+        info = schema_validation._get_validator.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+    def test_validator_rebuilt_after_schema_change(self):
+        """Test that editing the schema file invalidates the cached validator."""
+        partial = {"name": "example"}
+        self.assertFalse(self._validate(partial)["valid"])
+
+        relaxed = dict(TEST_SCHEMA, required=["name"])
+        self._write_schema(relaxed)
+        mtime = self.schema_path.stat().st_mtime + 10
+        os.utime(self.schema_path, (mtime, mtime))
+
+        self.assertTrue(self._validate(partial)["valid"])
+        self.assertEqual(schema_validation._get_validator.cache_info().misses, 2)
+
+    def test_invalid_schema(self):
+        """Test that a malformed schema is reported as a load error."""
+        self.schema_path.write_text("{not json", encoding="utf-8")
+        result = self._validate(VALID_DOC)
+        self.assertFalse(result["valid"])
+        self.assertTrue(result["errors"][0].startswith("Error loading schema"))
+
+        with self.assertRaises(ValueError):
+            self._validate(VALID_DOC, raise_exception=True)
+
+    def test_raise_exception(self):
+        """Test the message raised for an invalid document."""
+        result = self._validate(VALID_DOC, raise_exception=True)
+        self.assertTrue(result["valid"])
+
+        with self.assertRaises(jsonschema.exceptions.ValidationError) as context:
+            self._validate(INVALID_DOC, raise_exception=True)
+        message = context.exception.message
+        self.assertTrue(message.startswith("Validation failed: At "))
+        self.assertIn(message[len("Validation failed: "):],
+                      self._validate(INVALID_DOC)["errors"])
+
+    def test_schema_loaded_from_bytes(self):
+        """Test that the schema is read as bytes through the configured loader."""
+        with mock.patch.object(
+            schema_validation, "_json_loads", wraps=json.loads
+        ) as loads:
+            self.assertTrue(self._validate(VALID_DOC)["valid"])
+        loads.assert_called_once()
+        self.assertIsInstance(loads.call_args[0][0], bytes)
+
+    def test_missing_schema(self):
+        """Test handling of a schema file that does not exist."""
+        result = validate_against_schema(VALID_DOC, schema_file="missing.json")
+        self.assertFalse(result["valid"])
+        self.assertTrue(result["errors"][0].startswith("Schema file not found"))
+
+        with self.assertRaises(FileNotFoundError):
+            validate_against_schema(
+                VALID_DOC, schema_file="missing.json", raise_exception=True
+            )
+
+
+@unittest.skipUnless(HAS_JSONSCHEMA, "jsonschema package not installed")
+class TestGeneratedSummaryValidation(unittest.TestCase):
+    """Validate a summary produced by the analysis scripts with each backend."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        har_file = os.path.join(ROOT_DIR, "HAR-Files", "test_data_accuracy.har")
+        for script, dir_flag in (
+            ("break_har_for_single_analysis.py", "--output"),
+            ("analyze_single_har_performance.py", "--input"),
+        ):
+            subprocess.run(
+                [sys.executable, os.path.join(ROOT_DIR, "scripts", script),
+                 "--har", har_file, dir_flag, cls.temp_dir.name],
+                cwd=ROOT_DIR, capture_output=True, check=True
+            )
+        summary_file = Path(cls.temp_dir.name) / "agent_summary.json"
+        cls.summary = json.loads(summary_file.read_text(encoding="utf-8"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def _validate_with_backend(self, use_rs, data=None):
+        with mock.patch.object(schema_validation, "HAS_JSONSCHEMA_RS", use_rs):
+            schema_validation._get_validator.cache_clear()
+            try:
+                return validate_against_schema(self.summary if data is None else data)
+            finally:
+                schema_validation._get_validator.cache_clear()
+
+    def test_generated_summary_jsonschema(self):
+        """Test a generated summary passes with the jsonschema backend."""
+        result = self._validate_with_backend(False)
+        self.assertTrue(result["valid"], result["errors"])
+
+    @unittest.skipUnless(HAS_JSONSCHEMA_RS, "jsonschema-rs package not installed")
+    def test_generated_summary_jsonschema_rs(self):
+        """Test a generated summary passes with the jsonschema-rs backend."""
+        result = self._validate_with_backend(True)
+        self.assertTrue(result["valid"], result["errors"])
+
+    @unittest.skipUnless(HAS_JSONSCHEMA_RS, "jsonschema-rs package not installed")
+    def test_backends_agree_on_formats(self):
+        """Test that "format" is not enforced by either backend."""
+        summary = json.loads(json.dumps(self.summary))
+        summary["metadata"]["analysis_timestamp"] = "not a timestamp"
+        self.assertTrue(self._validate_with_backend(False, summary)["valid"])
+        self.assertTrue(self._validate_with_backend(True, summary)["valid"])
+
+    @unittest.skipUnless(HAS_JSONSCHEMA_RS, "jsonschema-rs package not installed")
+    def test_unsupported_types_fall_back(self):
+        """Test that non-JSON Python values are validated by jsonschema."""
+        for data in ({"x": datetime.now()}, {1: 2}, {"metadata": set()}):
+            expected = self._validate_with_backend(False, data)
+            result = self._validate_with_backend(True, data)
+            self.assertFalse(result["valid"])
+            self.assertEqual(result["errors"], expected["errors"])
+
+    def test_old_jsonschema_rs_ignored(self):
+        """Test that a jsonschema-rs without validate_formats is not used."""
+        def old_validator(schema):
+            return None
+
+        old_module = SimpleNamespace(Draft7Validator=old_validator)
+        with mock.patch.object(
+            schema_validation, "jsonschema_rs", old_module, create=True
+        ):
+            result = self._validate_with_backend(True)
+        self.assertTrue(result["valid"], result["errors"])
+
+
+class TestCheckMissingFields(unittest.TestCase):
+    """Test suite for check_missing_fields."""
+
+    def test_check_missing_fields(self):
+        """Test missing sections and fields are reported in order."""
+        data = {"a": {"x": 1}, "b": {}}
+        required = {"a": ["x", "y", "z"], "b": ["q"], "c": ["r"]}
+        self.assertEqual(check_missing_fields(data, required), [
+            "Missing required field: 'a.y'",
+            "Missing required field: 'a.z'",
+            "Missing required field: 'b.q'",
+            "Missing required section: 'c'"
+        ])
+        self.assertEqual(check_missing_fields(data, {"a": ["x"]}), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
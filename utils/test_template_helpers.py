@@ -40,6 +40,20 @@ class TestTemplateHelpers(unittest.TestCase):
         self.assertEqual(safe_get(data, "x", 42), 42)
         self.assertEqual(safe_get(None, "a", "default"), "default")
         self.assertEqual(safe_get({}, "a", "empty"), "empty")
+        self.assertEqual(safe_get(data, "b.c"), 2)
+        
+        # Non-string keys are looked up directly
+        self.assertEqual(safe_get({1: "x"}, 1), "x")
+        self.assertEqual(safe_get({None: "x"}, None), "x")
+        self.assertEqual(safe_get({1: "x"}, 2, "default"), "default")
+        
+        # Keys containing dots (domains, URLs) are matched as-is
+        self.assertEqual(safe_get({"cdn.example.com": 5}, "cdn.example.com", "dflt"), 5)
+        self.assertEqual(safe_get({"cdn.example.com": None}, "cdn.example.com", "dflt"), None)
+        self.assertEqual(safe_get({"a": {"b": 1}, "a.b": 2}, "a.b"), 2)
+        self.assertEqual(safe_get({"a": {"b": 1}}, "a.b"), 1)
+        self.assertEqual(safe_get({"a": {"b": 1}}, "a.c", "dflt"), "dflt")
+        self.assertEqual(safe_get([1], "a.b", "dflt"), "dflt")
 
     def test_safe_format_time(self):
         """Test safe_format_time function."""
@@ -79,6 +93,8 @@ class TestTemplateHelpers(unittest.TestCase):
         self.assertEqual(safe_json_parse(''), None)
         self.assertEqual(safe_json_parse(None), None)
         self.assertEqual(safe_json_parse('invalid', []), [])
+        self.assertEqual(safe_json_parse('  [1]'), [1])
+        self.assertEqual(safe_json_parse('<html>', {}), {})
 
     def test_truncate_url(self):
         """Test truncate_url function."""
@@ -96,6 +112,13 @@ class TestTemplateHelpers(unittest.TestCase):
         self.assertTrue(len(truncated) <= 30)
         self.assertTrue("..." in truncated)
         
+        # Exact output: path truncation keeps scheme and domain, a domain
+        # that is too long is kept without the scheme
+        self.assertEqual(truncate_url("https://example.com/very/long/path/that/exceeds/limit", 30),
+                         "https://example.com/very/lo...")
+        self.assertEqual(truncate_url("https://example.com/very/long/path", 10), "example...")
+        self.assertEqual(truncate_url("not a url but quite long text", 10), "not a u...")
+        
         self.assertEqual(truncate_url(""), "")
         self.assertEqual(truncate_url(None), "")
 
@@ -103,6 +126,9 @@ class TestTemplateHelpers(unittest.TestCase):
         """Test format_date function."""
         self.assertEqual(format_date("2023-07-25T12:34:56"), "July 25, 2023")
         self.assertEqual(format_date("2023-07-25"), "July 25, 2023")
+        self.assertEqual(format_date("2023-7-5"), "July 05, 2023")
+        self.assertEqual(format_date("2023-07-25T12:34:56Z"), "July 25, 2023")
+        self.assertEqual(format_date("2023-07-25Z"), "July 25, 2023")
         self.assertEqual(format_date(""), "Unknown date")
         self.assertEqual(format_date(None), "Unknown date")
         self.assertEqual(format_date("invalid"), "Unknown date")
@@ -7,11 +7,13 @@ Tests for the template_utilities module to ensure safe data handling.
 import unittest
 import sys
 import os
+from types import MappingProxyType
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.template_utilities import (
+    compile_path,
     safe_get, 
     safe_number, 
     format_ms, 
@@ -50,6 +52,32 @@ class TestTemplateUtilities(unittest.TestCase):
         self.assertIsNone(safe_get(test_data, "empty.anything"))
         self.assertIsNone(safe_get(None, "any.path"))
         self.assertEqual(safe_get({}, "any.path", "default"), "default")
+        
+        # Test stored None and non-dict intermediates
+        self.assertIsNone(safe_get(test_data, "empty", "default"))
+        self.assertEqual(safe_get(test_data, "metadata.har_name.x", "default"), "default")
+        
+        # Dotted paths are always split, even when a literal key matches
+        self.assertEqual(safe_get({"a": {"b": 1}, "a.b": 2}, "a.b"), 1)
+        self.assertEqual(safe_get({"cdn.example.com": 5}, "cdn.example.com", "default"), "default")
+        
+        # Non-dict mappings are handled the same for flat and dotted paths
+        proxy = MappingProxyType({"a": MappingProxyType({"b": 1})})
+        self.assertEqual(safe_get(proxy, "a.b"), 1)
+        self.assertEqual(safe_get(proxy["a"], "b"), 1)
+        self.assertEqual(safe_get(proxy, "missing", "default"), "default")
+        self.assertEqual(safe_get(proxy, "a.missing", "default"), "default")
+        
+        # Values without .get give the default for flat and dotted paths
+        for value in ([1, 2], "text", 42):
+            self.assertEqual(safe_get(value, "a", "default"), "default")
+            self.assertEqual(safe_get(value, "a.b", "default"), "default")
+    
+    def test_compile_path(self):
+        """Test that dotted paths are split and cached."""
+        self.assertEqual(compile_path("a.b.c"), ("a", "b", "c"))
+        self.assertEqual(compile_path("single"), ("single",))
+        self.assertIs(compile_path("a.b.c"), compile_path("a.b.c"))
     
     def test_safe_number(self):
         """Test the safe_number function for various inputs."""
@@ -109,6 +137,12 @@ class TestTemplateUtilities(unittest.TestCase):
         self.assertEqual(format_bytes(None), "0B")
         self.assertEqual(format_bytes("invalid", default="N/A"), "N/A")
         
+        # Test non-finite values
+        self.assertEqual(format_bytes(float("inf")), "infTB")
+        self.assertEqual(format_bytes(float("-inf")), "-infB")
+        self.assertEqual(format_bytes(float("nan")), "nanB")
+        self.assertEqual(format_bytes("1.0e400"), "infTB")
+        
     def test_ensure_list(self):
         """Test the ensure_list function."""
         # Test with lists
@@ -122,6 +156,8 @@ class TestTemplateUtilities(unittest.TestCase):
         
         # Test with JSON string
         self.assertEqual(ensure_list('[1, 2, 3]'), [1, 2, 3])
+        self.assertEqual(ensure_list('[1]'), [1])
+        self.assertEqual(ensure_list('[not json]'), ['[not json]'])
         
         # Test with dictionary
         self.assertEqual(ensure_list({"a": 1}), [{"a": 1}])